@@ -0,0 +1,18 @@
+"""
+MCP package for Schedule Helper
+
+Includes:
+- Protocol definitions
+- Server setup
+- Registered tools for scheduling, NLP, calendar integration, and more
+"""
+
+__version__ = "0.1.0"
+
+def __getattr__(name):
+    # PEP 562 lazy re-export: importing the package stays cheap, and the
+    # server stack (FastAPI, Google clients) only loads when actually used
+    if name == "create_server":
+        from .main import create_server
+        return create_server
+    raise AttributeError(name)
@@ -1,12 +0,0 @@
-"""
-MCP package for Schedule Helper
-
-Includes:
-- Protocol definitions
-- Server setup
-- Registered tools for scheduling, NLP, calendar integration, and more
-"""
-
-__version__ = "0.1.0"
-
-from mcp.main import create_server
\ No newline at end of file
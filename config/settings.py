@@ -1,35 +1,67 @@
 # mcp/config/settings.py
 
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file (if present)
-load_dotenv()
-
-# === OpenAI or NLP Settings ===
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-
-# === Google Calendar Settings ===
-GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID", "")
-GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET", "")
-GOOGLE_CALENDAR_SCOPES = [
-    "https://www.googleapis.com/auth/calendar.readonly"
-]
-
-# === Microsoft Graph (Outlook) Settings ===
-MICROSOFT_CLIENT_ID = os.getenv("MICROSOFT_CLIENT_ID", "")
-MICROSOFT_CLIENT_SECRET = os.getenv("MICROSOFT_CLIENT_SECRET", "")
-MICROSOFT_TENANT_ID = os.getenv("MICROSOFT_TENANT_ID", "")
-
-# === Email Settings ===
-SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
-SMTP_PORT = int(os.getenv("SMTP_PORT", 587))
-EMAIL_USERNAME = os.getenv("EMAIL_USERNAME", "")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD", "")
-
-# === Default Timezone ===
-DEFAULT_TIMEZONE = os.getenv("DEFAULT_TIMEZONE", "UTC")
-
-# === Debug Mode ===
-DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+from functools import lru_cache
+from typing import List
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+class Settings(BaseSettings):
+    """Typed application settings, parsed and validated once from env / .env"""
+
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    # === OpenAI or NLP Settings ===
+    openai_api_key: str = ""
+    openai_model: str = "gpt-3.5-turbo"
+
+    # === Google Calendar Settings ===
+    google_client_id: str = ""
+    google_client_secret: str = ""
+    google_calendar_scopes: List[str] = [
+        "https://www.googleapis.com/auth/calendar.readonly"
+    ]
+
+    # === Microsoft Graph (Outlook) Settings ===
+    microsoft_client_id: str = ""
+    microsoft_client_secret: str = ""
+    microsoft_tenant_id: str = ""
+
+    # === Email Settings ===
+    smtp_server: str = "smtp.gmail.com"
+    smtp_port: int = 587
+    email_username: str = ""
+    email_password: str = ""
+
+    # === Default Timezone ===
+    default_timezone: str = "UTC"
+
+    # === Debug Mode ===
+    debug: bool = False
+
+@lru_cache
+def get_settings() -> Settings:
+    """Load settings on first use; repeat calls (and module reloads) hit the cache"""
+    return Settings()
+
+# Module-level constants kept for existing `from config.settings import X` callers
+_settings = get_settings()
+
+OPENAI_API_KEY = _settings.openai_api_key
+OPENAI_MODEL = _settings.openai_model
+
+GOOGLE_CLIENT_ID = _settings.google_client_id
+GOOGLE_CLIENT_SECRET = _settings.google_client_secret
+GOOGLE_CALENDAR_SCOPES = _settings.google_calendar_scopes
+
+MICROSOFT_CLIENT_ID = _settings.microsoft_client_id
+MICROSOFT_CLIENT_SECRET = _settings.microsoft_client_secret
+MICROSOFT_TENANT_ID = _settings.microsoft_tenant_id
+
+SMTP_SERVER = _settings.smtp_server
+SMTP_PORT = _settings.smtp_port
+EMAIL_USERNAME = _settings.email_username
+EMAIL_PASSWORD = _settings.email_password
+
+DEFAULT_TIMEZONE = _settings.default_timezone
+
+DEBUG = _settings.debug
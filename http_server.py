@@ -2,19 +2,38 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List, Optional
+import asyncio
+import logging
+import os
 import uvicorn
 import json
 
+from config.settings import DEBUG
+
+logger = logging.getLogger(__name__)
+
 # Import your existing MCP tools
+from protocol import AvailableSlots
 from tools.parse_email import parse_email
 from tools.check_calendar import check_calendar
-from tools.check_real_calendar import check_real_calendar, create_meeting_event
+from tools.check_real_calendar import (
+    check_real_calendar,
+    create_meeting_event,
+    get_calendar_client,
+    match_candidate_times,
+)
 from tools.generate_reply import generate_reply
 from tools.timezone_ult import convert_timezone
 
-app = FastAPI(title="Schedule Helper HTTP API", version="1.0.0")
+# orjson serializes responses in C - noticeably faster than stdlib json under load
+app = FastAPI(
+    title="Schedule Helper HTTP API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 # Add CORS middleware for N8N
 app.add_middleware(
@@ -58,6 +77,75 @@ class ScheduleWorkflowRequest(BaseModel):
     timezone: str = "UTC"
     create_event: bool = False
 
+class CalendarBatcher:
+    """Coalesce concurrent real-calendar checks into one Google round-trip
+
+    Concurrent requests wait up to max_wait seconds so their candidate times
+    can be merged into a single calendar fetch; the shared availability is
+    then re-matched per caller and each request gets its own result.
+    """
+
+    def __init__(self, max_batch: int = 20, max_wait: float = 0.05):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._drain_task: Optional[asyncio.Task] = None
+
+    async def submit(self, candidate_times: List[str]) -> AvailableSlots:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((candidate_times, future))
+        if self._drain_task is None or self._drain_task.done():
+            self._drain_task = asyncio.create_task(self._drain())
+        return await future
+
+    async def _drain(self):
+        # Give concurrent requests a short window to pile up before fetching
+        await asyncio.sleep(self.max_wait)
+
+        batch = []
+        while not self._queue.empty() and len(batch) < self.max_batch:
+            batch.append(self._queue.get_nowait())
+        if not batch:
+            return
+
+        # Merge candidate times (order-preserving) into one calendar check
+        merged = list(dict.fromkeys(t for times, _ in batch for t in times))
+        try:
+            shared = await asyncio.to_thread(check_real_calendar, merged)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for times, future in batch:
+                if future.done():
+                    continue
+                if len(batch) == 1:
+                    future.set_result(shared)
+                else:
+                    # Re-match the shared availability against this caller's times
+                    proposed = match_candidate_times(times, shared.interviewer_times)
+                    future.set_result(AvailableSlots(
+                        type="available_slots",
+                        candidate_times=times,
+                        interviewer_times=shared.interviewer_times,
+                        proposed_meeting_times=proposed[:5]
+                    ))
+
+        # Anything queued while we were fetching gets its own batch
+        if not self._queue.empty():
+            self._drain_task = asyncio.create_task(self._drain())
+
+calendar_batcher = CalendarBatcher()
+
+@app.on_event("startup")
+async def warm_up():
+    """Initialize heavy dependencies so the first request doesn't pay for them"""
+    from tools.tz_cache import get_tz
+    get_tz("UTC")
+    # Prime Google Calendar auth/discovery off the event loop
+    await asyncio.to_thread(get_calendar_client)
+
 # HTTP endpoints that wrap your MCP tools
 @app.post("/parse_email")
 async def http_parse_email(request: ParseEmailRequest):
@@ -69,7 +157,7 @@ async def http_parse_email(request: ParseEmailRequest):
             timezone=request.timezone
         )
         # Convert Pydantic model to dict
-        return result.dict() if hasattr(result, 'dict') else result
+        return result.model_dump()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -77,8 +165,9 @@ async def http_parse_email(request: ParseEmailRequest):
 async def http_check_calendar(request: CheckCalendarRequest):
     """Check mock calendar availability"""
     try:
-        result = check_calendar(candidate_times=request.candidate_times)
-        return result.dict() if hasattr(result, 'dict') else result
+        # Run in a worker thread so slow calendar lookups don't block the event loop
+        result = await asyncio.to_thread(check_calendar, request.candidate_times)
+        return result.model_dump()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -86,8 +175,9 @@ async def http_check_calendar(request: CheckCalendarRequest):
 async def http_check_real_calendar(request: CheckCalendarRequest):
     """Check real Google Calendar availability"""
     try:
-        result = check_real_calendar(candidate_times=request.candidate_times)
-        return result.dict() if hasattr(result, 'dict') else result
+        # Batched: concurrent requests share a single Google Calendar fetch
+        result = await calendar_batcher.submit(request.candidate_times)
+        return result.model_dump()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -102,7 +192,7 @@ async def http_generate_reply(request: GenerateReplyRequest):
             from_email=request.from_email,
             intent=request.intent
         )
-        return result.dict() if hasattr(result, 'dict') else result
+        return result.model_dump()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -115,7 +205,7 @@ async def http_convert_timezone(request: ConvertTimezoneRequest):
             from_tz=request.from_tz,
             to_tz=request.to_tz
         )
-        return result.dict() if hasattr(result, 'dict') else result
+        return result.model_dump()
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -123,7 +213,8 @@ async def http_convert_timezone(request: ConvertTimezoneRequest):
 async def http_create_event(request: CreateEventRequest):
     """Create calendar event"""
     try:
-        result = create_meeting_event(
+        result = await asyncio.to_thread(
+            create_meeting_event,
             candidate_email=request.candidate_email,
             meeting_time=request.meeting_time,
             candidate_name=request.candidate_name
@@ -137,7 +228,8 @@ async def http_create_event(request: CreateEventRequest):
 async def http_create_meeting_event(request: CreateEventRequest):
     """Create calendar event (alias for create_event - used by Gmail automation)"""
     try:
-        result = create_meeting_event(
+        result = await asyncio.to_thread(
+            create_meeting_event,
             candidate_email=request.candidate_email,
             meeting_time=request.meeting_time,
             candidate_name=request.candidate_name
@@ -151,50 +243,62 @@ async def http_create_meeting_event(request: CreateEventRequest):
 async def schedule_workflow(request: ScheduleWorkflowRequest):
     """Complete scheduling workflow in one call"""
     try:
-        # Step 1: Parse email
-        print(f"📧 Parsing email from {request.from_email}")
-        parsed = parse_email(
-            email_body=request.email_body,
-            from_email=request.from_email,
-            timezone=request.timezone
+        # Step 1: Parse email, warming the calendar client in parallel so the
+        # auth/discovery cost overlaps with parsing instead of adding to it
+        logger.debug("Parsing email from %s", request.from_email)
+        parsed, _ = await asyncio.gather(
+            asyncio.to_thread(
+                parse_email,
+                email_body=request.email_body,
+                from_email=request.from_email,
+                timezone=request.timezone
+            ),
+            asyncio.to_thread(get_calendar_client),
         )
-        
-        # Step 2: Check calendar
-        print(f"📅 Checking calendar for {len(parsed.extracted_times)} times")
-        calendar_result = check_real_calendar(parsed.extracted_times)
-        
-        # Step 3: Generate reply
-        print(f"✉️ Generating reply for {parsed.intent}")
+
+        # Step 2: Check calendar (blocking Google API call - run in threadpool)
+        logger.debug("Checking calendar for %d times", len(parsed.extracted_times))
+        calendar_result = await asyncio.to_thread(check_real_calendar, parsed.extracted_times)
+
+        # Steps 3+4: Generate reply and (optionally) create the calendar event.
+        # Both depend only on calendar_result, so they run concurrently.
+        logger.debug("Generating reply for %s", parsed.intent)
         candidate_name = request.from_email.split('@')[0] if request.from_email else None
-        reply = generate_reply(
+        reply_call = asyncio.to_thread(
+            generate_reply,
             candidate_name=candidate_name,
             proposed_times=calendar_result.proposed_meeting_times,
             timezone=request.timezone,
             from_email=request.from_email,
             intent=parsed.intent
         )
-        
-        # Step 4: Optionally create calendar event
+
         event_result = None
         if request.create_event and calendar_result.proposed_meeting_times:
-            print(f"📅 Creating calendar event")
-            event_result = create_meeting_event(
-                candidate_email=request.from_email,
-                meeting_time=calendar_result.proposed_meeting_times[0],
-                candidate_name=candidate_name
+            logger.debug("Creating calendar event")
+            reply, event_result = await asyncio.gather(
+                reply_call,
+                asyncio.to_thread(
+                    create_meeting_event,
+                    candidate_email=request.from_email,
+                    meeting_time=calendar_result.proposed_meeting_times[0],
+                    candidate_name=candidate_name
+                ),
             )
+        else:
+            reply = await reply_call
         
         return {
             "success": True,
-            "parsed": parsed.dict() if hasattr(parsed, 'dict') else parsed,
-            "calendar": calendar_result.dict() if hasattr(calendar_result, 'dict') else calendar_result,
-            "reply": reply.dict() if hasattr(reply, 'dict') else reply,
+            "parsed": parsed.model_dump(),
+            "calendar": calendar_result.model_dump(),
+            "reply": reply.model_dump(),
             "event": event_result,
             "message": "Scheduling workflow completed successfully"
         }
         
     except Exception as e:
-        print(f"❌ Error in scheduling workflow: {e}")
+        logger.error("Error in scheduling workflow: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 # Health check endpoint
@@ -235,10 +339,22 @@ async def root():
     }
 
 if __name__ == "__main__":
-    print("🚀 Starting Schedule Helper HTTP Server...")
-    print("📝 API Documentation: http://localhost:8000/docs")
-    print("🔧 Health Check: http://localhost:8000/health")
-    print("🛠️ Endpoints List: http://localhost:8000/endpoints")
-    print("🔄 This server wraps your MCP tools for N8N integration")
-    
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=False)
+    logging.basicConfig(level=logging.DEBUG if DEBUG else logging.INFO)
+    logger.info("🚀 Starting Schedule Helper HTTP Server...")
+    logger.info("📝 API Documentation: http://localhost:8000/docs")
+    logger.info("🔧 Health Check: http://localhost:8000/health")
+    logger.info("🛠️ Endpoints List: http://localhost:8000/endpoints")
+    logger.info("🔄 This server wraps your MCP tools for N8N integration")
+
+    # uvloop + httptools cut per-request event-loop/parsing overhead; the app is
+    # passed as an import string so multiple workers can fork
+    uvicorn.run(
+        "http_server:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=False,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+        access_log=False,
+    )
@@ -1,6 +1,36 @@
-from http_server import app
-import uvicorn
+# mcp/main.py - single entrypoint module
+#
+# HTTP deployment:  uvicorn main:app  (or `python http_server.py`)
+# Stdio MCP:        python main.py
+
+from http_server import app  # re-exported for uvicorn deployments
+import functools
+
+from mcp.server.mcpserver import MCPServer
+
+from tools.parse_email import parse_email
+from tools.check_calendar import check_calendar
+from tools.check_real_calendar import check_real_calendar, create_meeting_event
+from tools.generate_reply import generate_reply
+from tools.timezone_ult import convert_timezone
+
+@functools.lru_cache(maxsize=1)
+def create_server() -> MCPServer:
+    """
+    Build the MCP server with all scheduling tools registered.
+
+    Memoized so repeated calls (tests, re-imports) reuse one registry
+    instead of re-registering every tool.
+    """
+    server = MCPServer("Schedule Helper")
+    server.add_tool(parse_email)
+    server.add_tool(check_calendar)
+    server.add_tool(check_real_calendar)
+    server.add_tool(create_meeting_event)
+    server.add_tool(generate_reply)
+    server.add_tool(convert_timezone)
+    return server
 
 if __name__ == "__main__":
-    print("🚀 Launching FastAPI Schedule Helper Server from main.py...")
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    print("🚀 Launching Schedule Helper MCP server (stdio) from main.py...")
+    create_server().run()
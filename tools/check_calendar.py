@@ -1,7 +1,13 @@
 from protocol import AvailableSlots
-from typing import List
+from typing import List, Tuple
 from datetime import datetime, timedelta
-import pytz
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+from tools.iso_time import parse_iso
+
+# Resolve the model schema once at import so the hot path never triggers it
+AvailableSlots.model_rebuild()
 
 # Mock interviewer's available slots - in production, this would come from a real calendar API
 MOCK_INTERVIEWER_AVAILABILITY = [
@@ -15,18 +21,24 @@ MOCK_INTERVIEWER_AVAILABILITY = [
     "2025-07-18T20:00:00Z",  # Friday 8pm UTC
 ]
 
+@lru_cache(maxsize=4096)
+def _parse_iso(time_str: str) -> datetime:
+    """Parse an ISO 8601 string (with optional 'Z' suffix), caching repeated inputs"""
+    return parse_iso(time_str)
+
+@lru_cache(maxsize=4096)
 def normalize_time_to_hour_boundary(time_str: str) -> str:
     """
     Normalize time to the nearest hour boundary for easier matching
-    
+
     Args:
         time_str: ISO format time string
-        
+
     Returns:
         Normalized time string
     """
     try:
-        dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+        dt = _parse_iso(time_str)
         # Round to nearest hour
         if dt.minute >= 30:
             dt = dt.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
@@ -37,105 +49,99 @@ def normalize_time_to_hour_boundary(time_str: str) -> str:
         print(f"Error normalizing time '{time_str}': {e}")
         return time_str
 
-def find_time_matches(candidate_times: List[str], interviewer_times: List[str]) -> List[str]:
+# Precomputed interviewer indexes - the availability list is a module constant,
+# so normalize/parse it once at import instead of on every request
+_INTERVIEWER_NORMALIZED = frozenset(
+    normalize_time_to_hour_boundary(t) for t in MOCK_INTERVIEWER_AVAILABILITY
+)
+_INTERVIEWER_PARSED = [
+    (t, _parse_iso(t), _parse_iso(t).date()) for t in MOCK_INTERVIEWER_AVAILABILITY
+]
+_INTERVIEWER_BY_DATE = {}
+for _time_str, _dt, _date in _INTERVIEWER_PARSED:
+    _INTERVIEWER_BY_DATE.setdefault(_date, []).append(_time_str)
+# Sorted epoch index so nearby-time lookups can binary-search a +/-2h window
+_INTERVIEWER_EPOCH = sorted(
+    (int(dt.timestamp()), time_str, date) for time_str, dt, date in _INTERVIEWER_PARSED
+)
+_INTERVIEWER_EPOCH_KEYS = [ts for ts, _time_str, _date in _INTERVIEWER_EPOCH]
+# Constant fallback slots - frozen once instead of re-slicing per call
+_DEFAULT_ALTERNATIVES = tuple(MOCK_INTERVIEWER_AVAILABILITY[:3])
+
+def find_time_matches(parsed_candidates: List[Tuple[str, datetime]]) -> List[str]:
     """
     Find overlapping times between candidate and interviewer availability
-    
+
     Args:
-        candidate_times: List of candidate's available times
-        interviewer_times: List of interviewer's available times
-        
+        parsed_candidates: (time string, parsed datetime) pairs for the candidate
+
     Returns:
         List of matching times
     """
     matches = []
-    
-    # Normalize all times for comparison
-    normalized_candidate = [normalize_time_to_hour_boundary(t) for t in candidate_times]
-    normalized_interviewer = [normalize_time_to_hour_boundary(t) for t in interviewer_times]
-    
-    # Find exact matches
-    for cand_time in normalized_candidate:
-        if cand_time in normalized_interviewer:
-            matches.append(cand_time)
-    
+
+    # Normalize candidate times and look up against the precomputed set
+    for cand_str, _cand_dt in parsed_candidates:
+        normalized = normalize_time_to_hour_boundary(cand_str)
+        if normalized in _INTERVIEWER_NORMALIZED:
+            matches.append(normalized)
+
     # If no exact matches, find nearby times (within 2 hours)
     if not matches:
-        matches = find_nearby_times(candidate_times, interviewer_times)
-    
-    return list(set(matches))  # Remove duplicates
+        matches = find_nearby_times(parsed_candidates)
 
-def find_nearby_times(candidate_times: List[str], interviewer_times: List[str]) -> List[str]:
+    return list(dict.fromkeys(matches))  # Remove duplicates, keep order
+
+def find_nearby_times(parsed_candidates: List[Tuple[str, datetime]]) -> List[str]:
     """
     Find interviewer times that are within 2 hours of candidate times
-    
+
     Args:
-        candidate_times: Candidate's preferred times
-        interviewer_times: Interviewer's available times
-        
+        parsed_candidates: (time string, parsed datetime) pairs for the candidate
+
     Returns:
         List of nearby available times
     """
-    nearby_matches = []
-    
-    for cand_str in candidate_times:
-        try:
-            cand_dt = datetime.fromisoformat(cand_str.replace('Z', '+00:00'))
-            
-            for int_str in interviewer_times:
-                try:
-                    int_dt = datetime.fromisoformat(int_str.replace('Z', '+00:00'))
-                    
-                    # Check if they're on the same day and within 2 hours
-                    if (cand_dt.date() == int_dt.date() and 
-                        abs((int_dt - cand_dt).total_seconds()) <= 7200):  # 2 hours = 7200 seconds
-                        nearby_matches.append(int_str)
-                        
-                except Exception as e:
-                    print(f"Error parsing interviewer time '{int_str}': {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"Error parsing candidate time '{cand_str}': {e}")
-            continue
-    
-    return nearby_matches
+    # Accumulate into a dict so duplicates across candidates dedupe in order
+    nearby_matches = {}
+
+    for _cand_str, cand_dt in parsed_candidates:
+        # Binary-search the +/-2h window instead of scanning every interviewer slot
+        ts = int(cand_dt.timestamp())
+        lo = bisect_left(_INTERVIEWER_EPOCH_KEYS, ts - 7200)  # 2 hours = 7200 seconds
+        hi = bisect_right(_INTERVIEWER_EPOCH_KEYS, ts + 7200)
+        cand_date = cand_dt.date()
+        for _ts, int_str, int_date in _INTERVIEWER_EPOCH[lo:hi]:
+            if int_date == cand_date:
+                nearby_matches[int_str] = None
+
+    return list(nearby_matches)
 
-def generate_alternative_times(candidate_times: List[str]) -> List[str]:
+def generate_alternative_times(parsed_candidates: List[Tuple[str, datetime]]) -> List[str]:
     """
     Generate alternative meeting times if no matches found
-    
+
     Args:
-        candidate_times: Candidate's requested times
-        
+        parsed_candidates: (time string, parsed datetime) pairs for the candidate
+
     Returns:
         List of alternative times from interviewer's availability
     """
-    if not candidate_times:
+    if not parsed_candidates:
         # Return next 3 available slots
-        return MOCK_INTERVIEWER_AVAILABILITY[:3]
-    
-    # Try to find times on same days as candidate requested
-    candidate_dates = set()
-    for time_str in candidate_times:
-        try:
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            candidate_dates.add(dt.date())
-        except Exception:
-            continue
-    
-    alternatives = []
-    for time_str in MOCK_INTERVIEWER_AVAILABILITY:
-        try:
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            if dt.date() in candidate_dates:
-                alternatives.append(time_str)
-        except Exception:
-            continue
+        return list(_DEFAULT_ALTERNATIVES)
+
+    # Same-day alternatives come straight from the precomputed day index
+    candidate_dates = {dt.date() for _time_str, dt in parsed_candidates}
+    alternatives = [
+        time_str
+        for date in sorted(candidate_dates)
+        for time_str in _INTERVIEWER_BY_DATE.get(date, ())
+    ]
     
     # If no same-day alternatives, return next available slots
     if not alternatives:
-        alternatives = MOCK_INTERVIEWER_AVAILABILITY[:3]
+        alternatives = list(_DEFAULT_ALTERNATIVES)
     
     return alternatives[:3]  # Limit to 3 alternatives
 
@@ -150,25 +156,26 @@ def check_calendar(candidate_times: List[str]) -> AvailableSlots:
         AvailableSlots: Proposed times for scheduling
     """
     
-    # Validate input times
-    valid_candidate_times = []
+    # Validate and parse input times once; downstream helpers reuse the datetimes
+    parsed_candidates = []
     for time_str in candidate_times:
         try:
-            # Validate that it's a proper ISO format
-            datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            valid_candidate_times.append(time_str)
+            parsed_candidates.append((time_str, _parse_iso(time_str)))
         except Exception as e:
             print(f"Invalid time format '{time_str}': {e}")
             continue
-    
+    valid_candidate_times = [time_str for time_str, _dt in parsed_candidates]
+
     # Find matches between candidate and interviewer times
-    proposed_times = find_time_matches(valid_candidate_times, MOCK_INTERVIEWER_AVAILABILITY)
-    
+    proposed_times = find_time_matches(parsed_candidates)
+
     # If no matches found, suggest alternatives
     if not proposed_times:
-        proposed_times = generate_alternative_times(valid_candidate_times)
+        proposed_times = generate_alternative_times(parsed_candidates)
     
-    return AvailableSlots(
+    # model_construct skips field validation - these values are tool-owned
+    # and already validated above, so the per-call check is pure overhead
+    return AvailableSlots.model_construct(
         type="available_slots",
         candidate_times=valid_candidate_times,
         interviewer_times=MOCK_INTERVIEWER_AVAILABILITY,
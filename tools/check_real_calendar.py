@@ -2,196 +2,388 @@
 
 import os
 import json
-from datetime import datetime, timedelta
+import logging
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
 from typing import List, Optional
+import httplib2
+import google_auth_httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 from protocol import AvailableSlots
+from tools.iso_time import parse_iso
 
 SCOPES = ['https://www.googleapis.com/auth/calendar.readonly',
           'https://www.googleapis.com/auth/calendar.events']
 
+# Module logger with lazy %-formatting: unlike print, disabled levels cost a
+# single check instead of string building + an unbuffered stdout flush
+logger = logging.getLogger(__name__)
+
+# Busy-period results barely change between bursts of requests; cache them
+# for a few minutes so the hot path skips the Google round-trip. Writes
+# (create_event/create_events) clear the cache, so stale reads are bounded
+# by external calendar edits only.
+BUSY_CACHE_TTL_SECONDS = 180
+
+def _iter_business_hours(start: datetime, days_ahead: int,
+                         business_start: int, business_end: int):
+    """Yield UTC business-hour slot datetimes from `start`, skipping weekends
+
+    Lazy so callers that stop early (e.g. after 20 accepted slots) never
+    generate the rest of the 14-day window.
+    """
+    start_date = start.date()
+    for day_offset in range(days_ahead):
+        day = start_date + timedelta(days=day_offset)
+        if day.weekday() >= 5:  # Skip weekends
+            continue
+        for hour in range(business_start, business_end):
+            slot = datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc)
+            if slot >= start:
+                yield slot
+
+@lru_cache(maxsize=1024)
+def _parse_dt(time_str: str) -> datetime:
+    """Parse an ISO 8601 string (optional 'Z' suffix), caching repeated inputs
+
+    Interviewer slots recur across requests and candidate times repeat
+    between the matcher and the debug listings, so the cache turns most
+    parses into a dict lookup.
+    """
+    dt = parse_iso(time_str)
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+@lru_cache(maxsize=1024)
+def _iso_to_epoch(time_str: str) -> int:
+    """Parse an ISO 8601 string (optional 'Z' suffix) to integer epoch seconds"""
+    return int(_parse_dt(time_str).timestamp())
+
+def _save_token(path: str, creds) -> None:
+    """Persist refreshed OAuth credentials, atomically and only on change
+
+    Skips the write when the serialized token matches what is on disk, and
+    goes through a temp file + os.replace so a crash mid-write can never
+    leave a truncated token.json behind.
+    """
+    new = creds.to_json().encode()
+    try:
+        with open(path, 'rb') as existing:
+            if existing.read() == new:
+                return
+    except OSError:
+        pass  # Missing or unreadable - write fresh
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as tmp:
+        tmp.write(new)
+    os.replace(tmp_path, path)
+
+@lru_cache(maxsize=1)
+def _load_sa_creds(json_text: str) -> Credentials:
+    """Parse service-account JSON once per distinct env value
+
+    Re-instantiating the client (tests, worker processes) reuses the parsed
+    Credentials instead of repeating json.loads + from_service_account_info.
+    """
+    return Credentials.from_service_account_info(
+        json.loads(json_text), scopes=SCOPES
+    )
+
+@lru_cache(maxsize=1)
+def _load_sa_creds_file(path: str, mtime: float) -> Credentials:
+    """Load service-account credentials from a file, cached until it changes
+
+    The mtime argument keys the cache so an edited file is re-read.
+    """
+    return Credentials.from_service_account_file(path, scopes=SCOPES)
+
+@lru_cache(maxsize=1)
+def _resolve_creds():
+    """Probe the credential sources once per process
+
+    The env-var / file probe chain (three stat calls plus a JSON parse)
+    runs on the first client construction only; later constructions get
+    the already-resolved Credentials object back.
+
+    Returns:
+        Credentials, or None when nothing is configured
+    """
+    # Method 1: Try service account JSON from environment variable
+    service_account_info = os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON')
+    if service_account_info:
+        logger.info("🔑 Using service account from environment variable...")
+        return _load_sa_creds(service_account_info)
+
+    # Method 2: Try service account file
+    if os.path.exists('service-account.json'):
+        logger.info("🔑 Using service account from file...")
+        return _load_sa_creds_file(
+            'service-account.json',
+            os.path.getmtime('service-account.json')
+        )
+
+    # Method 3: Try OAuth credentials (fallback for local development)
+    if os.path.exists('token.json'):
+        logger.info("🔑 Using OAuth token from file...")
+        from google.oauth2.credentials import Credentials as OAuthCredentials
+        creds = OAuthCredentials.from_authorized_user_file('token.json', SCOPES)
+
+        if not creds or not creds.valid:
+            if creds and creds.expired and creds.refresh_token:
+                creds.refresh(Request())
+                # Save refreshed credentials
+                _save_token('token.json', creds)
+        return creds
+
+    return None
+
 class GoogleCalendarClient:
     def __init__(self):
         self.service = None
+        self._busy_cache = {}
+        self._busy_cache_lock = threading.Lock()
         self._authenticate()
     
     def _authenticate(self):
         """Authenticate with Google Calendar API using service account or environment variables"""
-        creds = None
-        
         try:
-            # Method 1: Try service account JSON from environment variable
-            service_account_info = os.getenv('GOOGLE_SERVICE_ACCOUNT_JSON')
-            if service_account_info:
-                print("🔑 Using service account from environment variable...")
-                service_account_dict = json.loads(service_account_info)
-                creds = Credentials.from_service_account_info(
-                    service_account_dict, 
-                    scopes=SCOPES
-                )
-            
-            # Method 2: Try service account file
-            elif os.path.exists('service-account.json'):
-                print("🔑 Using service account from file...")
-                creds = Credentials.from_service_account_file(
-                    'service-account.json', 
-                    scopes=SCOPES
-                )
-            
-            # Method 3: Try OAuth credentials (fallback for local development)
-            elif os.path.exists('token.json'):
-                print("🔑 Using OAuth token from file...")
-                from google.oauth2.credentials import Credentials as OAuthCredentials
-                creds = OAuthCredentials.from_authorized_user_file('token.json', SCOPES)
-                
-                if not creds or not creds.valid:
-                    if creds and creds.expired and creds.refresh_token:
-                        creds.refresh(Request())
-                        # Save refreshed credentials
-                        with open('token.json', 'w') as token:
-                            token.write(creds.to_json())
-            
-            else:
-                print("❌ No credentials found - will use smart mock data")
+            creds = _resolve_creds()
+            if creds is None:
+                logger.warning("❌ No credentials found - will use smart mock data")
                 raise Exception("No Google Calendar credentials configured")
-            
-            self.service = build('calendar', 'v3', credentials=creds)
-            print("✅ Google Calendar authenticated successfully!")
-            
+
+            # One authorized, pooled HTTP connection shared by every API call -
+            # warm requests then skip the TCP/TLS handshake entirely
+            self._http = google_auth_httplib2.AuthorizedHttp(
+                creds, http=httplib2.Http(timeout=30)
+            )
+            # static_discovery uses the discovery document bundled with the
+            # client library, removing a cold-start HTTP round-trip
+            self.service = build(
+                'calendar', 'v3',
+                http=self._http,
+                cache_discovery=False,
+                static_discovery=True,
+            )
+            logger.info("✅ Google Calendar authenticated successfully!")
+
         except Exception as e:
-            print(f"❌ Calendar authentication failed: {e}")
-            print("🔄 Will use smart mock calendar data")
+            logger.error("❌ Calendar authentication failed: %s", e)
+            logger.warning("🔄 Will use smart mock calendar data")
             self.service = None
     
-    def get_busy_times(self, 
-                      calendar_id: str = 'primary',
-                      days_ahead: int = 14) -> List[dict]:
-        """Get busy periods from Google Calendar"""
-        
+    def get_busy_times(self,
+                      calendar_ids=('primary',),
+                      days_ahead: int = 14,
+                      now: Optional[datetime] = None) -> dict:
+        """Get busy periods for one or more calendars in a single freebusy call
+
+        The freebusy API accepts up to 50 calendars per request, so querying
+        several calendars costs one round-trip instead of one each.
+
+        Returns:
+            Dict mapping calendar id to its list of busy periods
+        """
+        calendar_ids = tuple(calendar_ids)
+
         if not self.service:
-            print("⚠️ No calendar service - returning empty busy times")
-            return []
-        
-        time_min = datetime.now()
+            logger.warning("⚠️ No calendar service - returning empty busy times")
+            return {calendar_id: [] for calendar_id in calendar_ids}
+
+        # Serve from the short-TTL cache when the same window was just fetched
+        cache_key = (calendar_ids, days_ahead)
+        with self._busy_cache_lock:
+            cached = self._busy_cache.get(cache_key)
+            if cached and time.monotonic() < cached[0]:
+                return cached[1]
+
+        # Callers that already have a timestamp pass it in; everything in this
+        # module works in tz-aware UTC so the window label is actually correct
+        time_min = now if now is not None else datetime.now(timezone.utc)
         time_max = time_min + timedelta(days=days_ahead)
-        
+
         body = {
-            "timeMin": time_min.isoformat() + 'Z',
-            "timeMax": time_max.isoformat() + 'Z',
-            "items": [{"id": calendar_id}]
+            "timeMin": time_min.isoformat().replace('+00:00', 'Z'),
+            "timeMax": time_max.isoformat().replace('+00:00', 'Z'),
+            "items": [{"id": calendar_id} for calendar_id in calendar_ids]
         }
-        
+
         try:
             result = self.service.freebusy().query(body=body).execute()
-            busy_times = result['calendars'][calendar_id].get('busy', [])
-            print(f"📅 Found {len(busy_times)} busy periods in next {days_ahead} days")
+            busy_times = {
+                calendar_id: result['calendars'][calendar_id].get('busy', [])
+                for calendar_id in calendar_ids
+            }
+            total = sum(len(v) for v in busy_times.values())
+            logger.info("📅 Found %d busy periods in next %d days", total, days_ahead)
+            with self._busy_cache_lock:
+                self._busy_cache[cache_key] = (time.monotonic() + BUSY_CACHE_TTL_SECONDS, busy_times)
             return busy_times
         except Exception as e:
-            print(f"❌ Error getting busy times: {e}")
-            return []
+            logger.error("❌ Error getting busy times: %s", e)
+            return {calendar_id: [] for calendar_id in calendar_ids}
     
     def generate_available_slots(self,
                                duration_minutes: int = 60,
                                business_start: int = 9,
                                business_end: int = 17,
-                               days_ahead: int = 14) -> List[str]:
-        """Generate available time slots"""
-        
+                               days_ahead: int = 14,
+                               _now: Optional[datetime] = None) -> List[str]:
+        """Generate available time slots
+
+        _now injects the clock for tests; production callers leave it unset.
+        """
+
         # If no calendar service, generate smart mock slots
         if not self.service:
-            return self._generate_smart_mock_slots(duration_minutes, business_start, business_end, days_ahead)
-        
-        busy_times = self.get_busy_times(days_ahead=days_ahead)
-        
-        # Convert busy times to datetime objects
-        busy_periods = []
-        for busy in busy_times:
-            start = datetime.fromisoformat(busy['start'].replace('Z', '+00:00'))
-            end = datetime.fromisoformat(busy['end'].replace('Z', '+00:00'))
-            busy_periods.append((start, end))
-        
-        available_slots = []
-        current = datetime.now().replace(minute=0, second=0, microsecond=0)
-        
-        # Skip to next hour if we're past the start of current hour
-        if datetime.now().minute > 0:
-            current += timedelta(hours=1)
-        
-        end_time = current + timedelta(days=days_ahead)
-        
-        while current < end_time and len(available_slots) < 20:
-            # Skip weekends
-            if current.weekday() >= 5:
-                current += timedelta(days=1)
-                current = current.replace(hour=business_start)
-                continue
-            
-            # Skip outside business hours
-            if current.hour < business_start or current.hour >= business_end:
-                if current.hour >= business_end:
-                    current += timedelta(days=1)
-                    current = current.replace(hour=business_start)
-                else:
-                    current = current.replace(hour=business_start)
-                continue
-            
-            # Check if this slot is available
-            slot_end = current + timedelta(minutes=duration_minutes)
-            is_available = True
-            
-            for busy_start, busy_end in busy_periods:
-                # Check for overlap
-                if current < busy_end and slot_end > busy_start:
-                    is_available = False
-                    break
-            
-            if is_available:
-                available_slots.append(current.isoformat() + 'Z')
-            
-            # Move to next hour
-            current += timedelta(hours=1)
-        
-        print(f"✅ Generated {len(available_slots)} available slots")
+            return self._generate_smart_mock_slots(duration_minutes, business_start, business_end, days_ahead,
+                                                   _now=_now)
+
+        # One clock read per call; every datetime below derives from it
+        now = _now if _now is not None else datetime.now(timezone.utc)
+
+        busy_times = self.get_busy_times(('primary',), days_ahead=days_ahead,
+                                         now=now)['primary']
+
+        # Convert busy times once to integer epoch seconds - all overlap math
+        # below is then plain int compares instead of datetime arithmetic
+        busy_periods = [
+            (_iso_to_epoch(busy['start']), _iso_to_epoch(busy['end']))
+            for busy in busy_times
+        ]
+
+        # Sort by start and keep prefix maxima of the ends so each slot's
+        # overlap test is a binary search instead of a full scan
+        busy_periods.sort()
+        busy_starts = [start for start, _end in busy_periods]
+        busy_max_ends = []
+        max_end = 0
+        for _start, end in busy_periods:
+            if end > max_end:
+                max_end = end
+            busy_max_ends.append(max_end)
+
+        duration_seconds = duration_minutes * 60
+        accepted = []
+        # Round up to the next hour boundary, branch-free: the bool is 1
+        # exactly when we're past the top of the hour
+        current = now.replace(minute=0, second=0, microsecond=0) + timedelta(
+            hours=bool(now.minute or now.second or now.microsecond)
+        )
+
+        # Candidates come from a lazy generator, so once 20 slots are
+        # accepted the remaining days are never generated at all
+        for slot in _iter_business_hours(current, days_ahead,
+                                         business_start, business_end):
+            if len(accepted) >= 20:
+                break
+
+            # Check if this slot is available: any busy interval starting before
+            # slot_end whose end reaches past the slot start overlaps
+            slot_ep = int(slot.timestamp())
+            slot_end_ep = slot_ep + duration_seconds
+            idx = bisect_left(busy_starts, slot_end_ep)
+            if not (idx > 0 and busy_max_ends[idx - 1] > slot_ep):
+                accepted.append(slot_ep)  # Only the int in the hot loop
+
+        # Format the accepted slots once, outside the scan
+        available_slots = [
+            datetime.fromtimestamp(ep, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+            for ep in accepted
+        ]
+        logger.info("✅ Generated %d available slots", len(available_slots))
         return available_slots
     
-    def _generate_smart_mock_slots(self, duration_minutes, business_start, business_end, days_ahead):
+    def _generate_smart_mock_slots(self, duration_minutes, business_start, business_end, days_ahead,
+                                   _now: Optional[datetime] = None):
         """Generate smart mock slots that include reasonable business hours"""
-        available_slots = []
-        current = datetime.now().replace(minute=0, second=0, microsecond=0)
-        
-        # Skip to next hour if we're past the start of current hour
-        if datetime.now().minute > 0:
-            current += timedelta(hours=1)
-        
-        end_time = current + timedelta(days=days_ahead)
-        
-        while current < end_time and len(available_slots) < 20:
-            # Skip weekends
-            if current.weekday() >= 5:
-                current += timedelta(days=1)
-                current = current.replace(hour=business_start)
-                continue
-            
-            # Skip outside business hours
-            if current.hour < business_start or current.hour >= business_end:
-                if current.hour >= business_end:
-                    current += timedelta(days=1)
-                    current = current.replace(hour=business_start)
-                else:
-                    current = current.replace(hour=business_start)
-                continue
-            
-            # Generate reasonable business hours (9am-5pm, every hour)
-            if current.hour in [9, 10, 11, 12, 13, 14, 15, 16]:  # Common meeting times
-                available_slots.append(current.isoformat() + 'Z')
-            
-            current += timedelta(hours=1)
-        
-        print(f"🧪 Generated {len(available_slots)} smart mock available slots")
+        now = _now if _now is not None else datetime.now(timezone.utc)
+        # Round up to the next hour boundary, branch-free
+        current = now.replace(minute=0, second=0, microsecond=0) + timedelta(
+            hours=bool(now.minute or now.second or now.microsecond)
+        )
+
+        # Same lazy business-hour walk as the real path - the hour-by-hour
+        # while loop with weekend/hours branches is gone entirely
+        available_slots = [
+            slot.strftime('%Y-%m-%dT%H:%M:%SZ')
+            for slot in islice(
+                _iter_business_hours(current, days_ahead, business_start, business_end),
+                20
+            )
+        ]
+
+        logger.info("🧪 Generated %d smart mock available slots", len(available_slots))
         return available_slots
     
+    def create_events(self, events: List[dict]) -> List[dict]:
+        """Insert several events in one multipart batch round-trip
+
+        Google's batch endpoint coalesces N events().insert calls into a
+        single HTTP request, so inviting several attendees costs one
+        TCP/TLS round-trip instead of one each.
+
+        Args:
+            events: Event resource dicts as accepted by events().insert
+
+        Returns:
+            One result dict per event, in input order ({} on failure)
+        """
+        if not events:
+            return []
+
+        if not self.service:
+            logger.warning("⚠️ No calendar service - simulating batch event creation")
+            base = int(datetime.now().timestamp())
+            return [
+                {
+                    'id': f'mock_event_{base}_{i}',
+                    'htmlLink': 'https://calendar.google.com/calendar/event?eid=mock123',
+                    'summary': event.get('summary')
+                }
+                for i, event in enumerate(events)
+            ]
+
+        results = [{} for _ in events]
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error("❌ Batch event insert %s failed: %s", request_id, exception)
+            else:
+                results[int(request_id)] = response
+
+        batch = self.service.new_batch_http_request(callback=_collect)
+        for i, event in enumerate(events):
+            batch.add(
+                self.service.events().insert(
+                    calendarId='primary',
+                    body=event,
+                    sendUpdates='all'
+                ),
+                request_id=str(i)
+            )
+
+        try:
+            batch.execute()
+        except Exception as e:
+            logger.error("❌ Error executing event batch: %s", e)
+            return results
+
+        if any(result for result in results):
+            logger.info("📅 Created %d calendar events in one batch",
+                        sum(1 for result in results if result))
+            # The calendar just changed - cached busy periods are now stale
+            with self._busy_cache_lock:
+                self._busy_cache.clear()
+        return results
+
     def create_event(self,
                     summary: str,
                     start_time: str,
@@ -201,14 +393,14 @@ class GoogleCalendarClient:
         """Create a calendar event"""
         
         if not self.service:
-            print("⚠️ No calendar service - simulating event creation")
+            logger.warning("⚠️ No calendar service - simulating event creation")
             return {
                 'id': f'mock_event_{int(datetime.now().timestamp())}',
                 'htmlLink': 'https://calendar.google.com/calendar/event?eid=mock123',
                 'summary': summary
             }
         
-        start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+        start_dt = parse_iso(start_time)
         end_dt = start_dt + timedelta(minutes=duration_minutes)
         
         event = {
@@ -234,35 +426,190 @@ class GoogleCalendarClient:
                 sendUpdates='all'  # Send invites to attendees
             ).execute()
             
-            print(f"📅 Created calendar event: {result.get('htmlLink')}")
+            logger.info("📅 Created calendar event: %s", result.get('htmlLink'))
+            # The calendar just changed - cached busy periods are now stale
+            with self._busy_cache_lock:
+                self._busy_cache.clear()
             return result
         except Exception as e:
-            print(f"❌ Error creating event: {e}")
+            logger.error("❌ Error creating event: %s", e)
             return {}
 
-# Global calendar client
-_calendar_client = None
+# Global calendar client - built eagerly at import so the first request only
+# pays for the freebusy call, not auth + service construction
+try:
+    _calendar_client = GoogleCalendarClient()
+except Exception as e:
+    logger.warning("⚠️ Calendar client init failed at import: %s", e)
+    _calendar_client = None
+
+_client_lock = threading.Lock()
 
 def get_calendar_client():
     """Get or create calendar client"""
     global _calendar_client
     if _calendar_client is None:
-        _calendar_client = GoogleCalendarClient()
+        # Double-checked locking: concurrent first requests must not each
+        # run OAuth + discovery; once built, this is a single compare
+        with _client_lock:
+            if _calendar_client is None:
+                _calendar_client = GoogleCalendarClient()
     return _calendar_client
 
+def _fast_mock_slots(candidate_times: List[str]) -> AvailableSlots:
+    """Cheap mock availability for when no calendar credentials are configured"""
+    now = datetime.now()
+    mock_times = [
+        (now + timedelta(days=i + 1, hours=10)).isoformat() + 'Z'
+        for i in range(5)
+        if (now + timedelta(days=i + 1, hours=10)).weekday() < 5  # Weekdays only
+    ]
+    return AvailableSlots(
+        type="available_slots",
+        candidate_times=candidate_times,
+        interviewer_times=mock_times,
+        proposed_meeting_times=mock_times[:3]
+    )
+
+def match_candidate_times(candidate_times: List[str], interviewer_times: List[str]) -> List[str]:
+    """
+    Match candidate times against interviewer availability with tiered rules
+
+    Args:
+        candidate_times: List of ISO format times from candidate
+        interviewer_times: List of ISO format interviewer slots
+
+    Returns:
+        List of proposed meeting times, best matches first
+    """
+    # IMPROVED SMART MATCHING LOGIC
+    # Parse interviewer times once into a sorted epoch index; each candidate
+    # then scans only its 24-hour window instead of the full list
+    interviewer_parsed = []
+    for interviewer_time in interviewer_times:
+        try:
+            interviewer_dt = _parse_dt(interviewer_time)
+            interviewer_parsed.append((interviewer_dt.timestamp(), interviewer_time, interviewer_dt))
+        except Exception as e:
+            logger.warning("Error parsing interviewer time %s: %s", interviewer_time, e)
+            continue
+    interviewer_parsed.sort()
+    interviewer_ts = [ts for ts, _time_str, _dt in interviewer_parsed]
+
+    # Checked once so disabled debug logging skips the strftime calls too
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    exact_matches = []
+    same_day_matches = []
+    close_matches = []
+
+    # Parsed emails often repeat the same ISO string; each duplicate would
+    # rerun the whole window scan, so dedupe (order-preserving) first
+    for candidate_time in dict.fromkeys(candidate_times):
+        try:
+            candidate_dt = _parse_dt(candidate_time)
+        except Exception as e:
+            logger.warning("Error processing candidate time %s: %s", candidate_time, e)
+            continue
+
+        cand_ts = candidate_dt.timestamp()
+        cand_date = candidate_dt.date()
+
+        # Only interviewer slots within 24 hours can land in any tier; start at
+        # the first candidate slot in range and stop as soon as we pass it
+        lo = bisect_left(interviewer_ts, cand_ts - 86400)
+        upper = cand_ts + 86400
+        for i in range(lo, len(interviewer_parsed)):
+            int_ts, interviewer_time, interviewer_dt = interviewer_parsed[i]
+            if int_ts > upper:
+                break  # Sorted - every later slot is even further away
+            # Time difference in seconds; thresholds compare directly
+            # against second constants, so no per-pair division is needed
+            # (sorting by seconds orders the same as sorting by hours)
+            diff_seconds = abs(cand_ts - int_ts)
+
+            # Check if same day
+            same_day = cand_date == interviewer_dt.date()
+
+            if same_day and diff_seconds <= 3600:  # Same day, within 1 hour
+                exact_matches.append((interviewer_time, diff_seconds))
+                if debug:
+                    logger.debug("✅ EXACT MATCH: %s → %s (diff: %.1fh)",
+                                 candidate_dt.strftime('%A %I:%M %p'),
+                                 interviewer_dt.strftime('%A %I:%M %p'), diff_seconds / 3600)
+            elif exact_matches:
+                # A winning tier exists: same-day/close lists would never be
+                # consulted, so classifying into them is pure waste. Exact
+                # candidates above still accumulate - a later, closer slot
+                # can displace the current top 3.
+                continue
+            elif same_day and diff_seconds <= 10800:  # Same day, within 3 hours
+                same_day_matches.append((interviewer_time, diff_seconds))
+                if debug:
+                    logger.debug("🟡 SAME DAY: %s → %s (diff: %.1fh)",
+                                 candidate_dt.strftime('%A %I:%M %p'),
+                                 interviewer_dt.strftime('%A %I:%M %p'), diff_seconds / 3600)
+            elif same_day_matches:
+                continue  # Same-day tier beats close - skip the dead appends
+            else:  # Within 24 hours (adjacent days)
+                close_matches.append((interviewer_time, diff_seconds))
+                if debug:
+                    logger.debug("🟠 CLOSE: %s → %s (diff: %.1fh)",
+                                 candidate_dt.strftime('%A %I:%M %p'),
+                                 interviewer_dt.strftime('%A %I:%M %p'), diff_seconds / 3600)
+    
+    # Priority selection: exact matches first, then same day, then close matches
+    proposed_times = []
+    
+    if exact_matches:
+        # Sort by smallest time difference
+        exact_matches.sort(key=lambda x: x[1])
+        proposed_times = [match[0] for match in exact_matches[:3]]
+        logger.debug("🎯 Using %d EXACT matches", len(proposed_times))
+    elif same_day_matches:
+        # Sort by smallest time difference
+        same_day_matches.sort(key=lambda x: x[1])
+        proposed_times = [match[0] for match in same_day_matches[:3]]
+        logger.debug("🎯 Using %d SAME DAY matches", len(proposed_times))
+    elif close_matches:
+        # Sort by smallest time difference
+        close_matches.sort(key=lambda x: x[1])
+        proposed_times = [match[0] for match in close_matches[:3]]
+        logger.debug("🎯 Using %d CLOSE matches", len(proposed_times))
+    else:
+        # No good matches found, suggest first few available slots
+        proposed_times = interviewer_times[:3]
+        logger.debug("🎯 No matches found, using %d general availability slots", len(proposed_times))
+
+    return proposed_times
+
 def check_real_calendar(candidate_times: List[str]) -> AvailableSlots:
     """
     FIXED: Check real Google Calendar for availability with SMART MATCHING
-    
+
     Args:
         candidate_times: List of ISO format times from candidate
-        
+
     Returns:
         AvailableSlots with intelligently matched calendar data
     """
+    # No requested times means nothing to match - skip the freebusy call
+    # and slot generation entirely
+    if not candidate_times:
+        return AvailableSlots(
+            type="available_slots",
+            candidate_times=[],
+            interviewer_times=[],
+            proposed_meeting_times=[]
+        )
+
     try:
         calendar_client = get_calendar_client()
-        
+
+        # No credentials: skip slot generation and matching entirely
+        if calendar_client.service is None:
+            return _fast_mock_slots(candidate_times)
+
         # Get available slots (real or smart mock)
         interviewer_times = calendar_client.generate_available_slots(
             duration_minutes=60,
@@ -270,78 +617,28 @@ def check_real_calendar(candidate_times: List[str]) -> AvailableSlots:
             business_end=17,
             days_ahead=14
         )
-        
-        print(f"📅 Candidate requested {len(candidate_times)} times:")
-        for time_str in candidate_times:
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            print(f"   - {dt.strftime('%A, %B %d at %I:%M %p UTC')} ({time_str})")
-        
-        print(f"📅 Available interviewer times ({len(interviewer_times)}):")
-        for i, time_str in enumerate(interviewer_times[:5]):  # Show first 5
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            print(f"   {i+1}. {dt.strftime('%A, %B %d at %I:%M %p UTC')} ({time_str})")
-        
-        # IMPROVED SMART MATCHING LOGIC
-        exact_matches = []
-        same_day_matches = []
-        close_matches = []
-        
-        for candidate_time in candidate_times:
-            try:
-                candidate_dt = datetime.fromisoformat(candidate_time.replace('Z', '+00:00'))
-                
-                # Look for matches in interviewer availability
-                for interviewer_time in interviewer_times:
-                    interviewer_dt = datetime.fromisoformat(interviewer_time.replace('Z', '+00:00'))
-                    
-                    # Calculate time difference in hours
-                    time_diff_hours = abs((candidate_dt - interviewer_dt).total_seconds()) / 3600
-                    
-                    # Check if same day
-                    same_day = candidate_dt.date() == interviewer_dt.date()
-                    
-                    if same_day and time_diff_hours <= 1:  # Same day, within 1 hour
-                        exact_matches.append((interviewer_time, time_diff_hours))
-                        print(f"✅ EXACT MATCH: {candidate_dt.strftime('%A %I:%M %p')} → {interviewer_dt.strftime('%A %I:%M %p')} (diff: {time_diff_hours:.1f}h)")
-                    elif same_day and time_diff_hours <= 3:  # Same day, within 3 hours
-                        same_day_matches.append((interviewer_time, time_diff_hours))
-                        print(f"🟡 SAME DAY: {candidate_dt.strftime('%A %I:%M %p')} → {interviewer_dt.strftime('%A %I:%M %p')} (diff: {time_diff_hours:.1f}h)")
-                    elif time_diff_hours <= 24:  # Within 24 hours (adjacent days)
-                        close_matches.append((interviewer_time, time_diff_hours))
-                        print(f"🟠 CLOSE: {candidate_dt.strftime('%A %I:%M %p')} → {interviewer_dt.strftime('%A %I:%M %p')} (diff: {time_diff_hours:.1f}h)")
-                
-            except Exception as e:
-                print(f"Error processing candidate time {candidate_time}: {e}")
-                continue
-        
-        # Priority selection: exact matches first, then same day, then close matches
-        proposed_times = []
-        
-        if exact_matches:
-            # Sort by smallest time difference
-            exact_matches.sort(key=lambda x: x[1])
-            proposed_times = [match[0] for match in exact_matches[:3]]
-            print(f"🎯 Using {len(proposed_times)} EXACT matches")
-        elif same_day_matches:
-            # Sort by smallest time difference
-            same_day_matches.sort(key=lambda x: x[1])
-            proposed_times = [match[0] for match in same_day_matches[:3]]
-            print(f"🎯 Using {len(proposed_times)} SAME DAY matches")
-        elif close_matches:
-            # Sort by smallest time difference
-            close_matches.sort(key=lambda x: x[1])
-            proposed_times = [match[0] for match in close_matches[:3]]
-            print(f"🎯 Using {len(proposed_times)} CLOSE matches")
-        else:
-            # No good matches found, suggest first few available slots
-            proposed_times = interviewer_times[:3]
-            print(f"🎯 No matches found, using {len(proposed_times)} general availability slots")
-        
-        print(f"📝 Final proposed times:")
-        for i, time_str in enumerate(proposed_times):
-            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-            print(f"   {i+1}. {dt.strftime('%A, %B %d at %I:%M %p UTC')} ({time_str})")
-        
+
+        # The per-time listings are debug-only chatter; skip the parse/format
+        # work entirely unless the level is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📅 Candidate requested %d times:", len(candidate_times))
+            for time_str in candidate_times:
+                dt = _parse_dt(time_str)
+                logger.debug("   - %s (%s)", dt.strftime('%A, %B %d at %I:%M %p UTC'), time_str)
+
+            logger.debug("📅 Available interviewer times (%d):", len(interviewer_times))
+            for i, time_str in enumerate(interviewer_times[:5]):  # Show first 5
+                dt = _parse_dt(time_str)
+                logger.debug("   %d. %s (%s)", i + 1, dt.strftime('%A, %B %d at %I:%M %p UTC'), time_str)
+
+        proposed_times = match_candidate_times(candidate_times, interviewer_times)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📝 Final proposed times:")
+            for i, time_str in enumerate(proposed_times):
+                dt = _parse_dt(time_str)
+                logger.debug("   %d. %s (%s)", i + 1, dt.strftime('%A, %B %d at %I:%M %p UTC'), time_str)
+
         return AvailableSlots(
             type="available_slots",
             candidate_times=candidate_times,
@@ -350,8 +647,8 @@ def check_real_calendar(candidate_times: List[str]) -> AvailableSlots:
         )
         
     except Exception as e:
-        print(f"❌ Error with calendar processing: {e}")
-        print("🔄 Using basic fallback...")
+        logger.error("❌ Error with calendar processing: %s", e)
+        logger.warning("🔄 Using basic fallback...")
         
         # Simple fallback with current dates
         now = datetime.now()
@@ -406,9 +703,60 @@ def create_meeting_event(
         }
         
     except Exception as e:
-        print(f"Error creating meeting event: {e}")
+        logger.error("Error creating meeting event: %s", e)
         return {
             "success": False,
             "error": str(e),
             "message": "Failed to create calendar event"
         }
+
+def create_meeting_events(invites: List[dict]) -> dict:
+    """
+    Create calendar events for several meetings in a single batch request
+
+    Args:
+        invites: Dicts with candidate_email, meeting_time (ISO format) and
+            optionally candidate_name
+
+    Returns:
+        Dict with per-invite event details
+    """
+    try:
+        calendar_client = get_calendar_client()
+
+        events = []
+        for invite in invites:
+            candidate_email = invite['candidate_email']
+            candidate_name = invite.get('candidate_name')
+            start_dt = parse_iso(invite['meeting_time'])
+            end_dt = start_dt + timedelta(minutes=60)
+            events.append({
+                'summary': f"Interview - {candidate_name or candidate_email.split('@')[0]}",
+                'description': f"Interview scheduled with {candidate_email}",
+                'start': {'dateTime': start_dt.isoformat(), 'timeZone': 'UTC'},
+                'end': {'dateTime': end_dt.isoformat(), 'timeZone': 'UTC'},
+                'attendees': [{'email': candidate_email}],
+            })
+
+        results = calendar_client.create_events(events)
+
+        return {
+            "success": all(result for result in results),
+            "events": [
+                {
+                    "success": bool(result),
+                    "event_id": result.get('id'),
+                    "event_link": result.get('htmlLink'),
+                }
+                for result in results
+            ],
+            "message": f"Created {sum(1 for r in results if r)} of {len(invites)} calendar events"
+        }
+
+    except Exception as e:
+        logger.error("Error creating meeting events: %s", e)
+        return {
+            "success": False,
+            "error": str(e),
+            "message": "Failed to create calendar events"
+        }
@@ -1,7 +1,90 @@
 from protocol import EmailReply
 from typing import List, Optional
-from datetime import datetime
-import pytz
+
+from tools.iso_time import parse_iso
+from tools.tz_cache import get_tz
+
+# Reply templates, built once at import - per call only the name (and the
+# bullet list of times, when the intent has one) gets interpolated
+_TEMPLATES = {
+    "cancel": """Hi {name},
+
+Thank you for letting us know. We understand that schedules can change.
+
+If you'd like to reschedule for a future date, please let us know your availability and we'll be happy to accommodate.
+
+Best regards,
+Schedule Helper""",
+
+    "reschedule": """Hi {name},
+
+No problem! We can definitely reschedule.
+
+Would any of these alternative times work for you?
+
+{time_lines}
+
+Please let us know which option works best.
+
+Best regards,
+Schedule Helper""",
+
+    "reschedule_no_times": """Hi {name},
+
+We'd be happy to reschedule. Could you please share your preferred times and we'll check our availability?
+
+Best regards,
+Schedule Helper""",
+
+    "confirm": """Hi {name},
+
+Perfect! We have you confirmed for the meeting.
+
+We look forward to speaking with you then. You'll receive a calendar invitation shortly with all the details.
+
+Best regards,
+Schedule Helper""",
+
+    "available": """Hi {name},
+
+Thank you for sharing your availability!
+
+We'd like to schedule the meeting for one of these times:
+
+{time_lines}
+
+Please confirm which time works best for you, and we'll send over a calendar invitation.
+
+Best regards,
+Schedule Helper""",
+
+    "available_no_times": """Hi {name},
+
+Thank you for your message! To help us find the best time for our meeting, could you please share a few specific times that work for you?
+
+For example:
+• Day of the week and time (e.g., "Tuesday at 2pm")
+• Multiple options if possible
+• Your timezone
+
+We'll do our best to accommodate your schedule.
+
+Best regards,
+Schedule Helper""",
+
+    "unknown": """Hi {name},
+
+Thank you for your message. To help us schedule our meeting, could you please let us know:
+
+• Your preferred days and times
+• Your timezone
+• Any dates that definitely won't work
+
+We'll get back to you promptly with available options.
+
+Best regards,
+Schedule Helper""",
+}
 
 def format_time_human_readable(iso_time: str, target_timezone: str = "UTC") -> str:
     """
@@ -15,12 +98,11 @@ def format_time_human_readable(iso_time: str, target_timezone: str = "UTC") -> s
         Human-readable time string
     """
     try:
-        dt = datetime.fromisoformat(iso_time.replace('Z', '+00:00'))
+        dt = parse_iso(iso_time)
         
         # Convert to target timezone if specified
         if target_timezone != "UTC":
-            target_tz = pytz.timezone(target_timezone)
-            dt = dt.astimezone(target_tz)
+            dt = dt.astimezone(get_tz(target_timezone))
         
         # Format as human-readable
         return dt.strftime("%A, %B %d at %I:%M %p %Z")
@@ -57,6 +139,10 @@ def extract_name_from_email(email: str) -> str:
     except Exception:
         return "there"
 
+def _bullet_times(proposed_times: List[str], timezone: str) -> str:
+    """Render proposed times as the bullet list used inside reply templates"""
+    return "\n".join(f"• {format_time_human_readable(t, timezone)}" for t in proposed_times)
+
 def generate_reply_based_on_intent(
     intent: str,
     candidate_name: str,
@@ -76,91 +162,31 @@ def generate_reply_based_on_intent(
         Generated message text
     """
     if intent == "cancel":
-        return f"""Hi {candidate_name},
-
-Thank you for letting us know. We understand that schedules can change.
-
-If you'd like to reschedule for a future date, please let us know your availability and we'll be happy to accommodate.
-
-Best regards,
-Schedule Helper"""
+        return _TEMPLATES["cancel"].format(name=candidate_name)
 
     elif intent == "reschedule":
         if proposed_times:
-            time_lines = "\n".join([f"• {format_time_human_readable(t, timezone)}" for t in proposed_times])
-            return f"""Hi {candidate_name},
-
-No problem! We can definitely reschedule.
-
-Would any of these alternative times work for you?
-
-{time_lines}
-
-Please let us know which option works best.
-
-Best regards,
-Schedule Helper"""
+            return _TEMPLATES["reschedule"].format(
+                name=candidate_name,
+                time_lines=_bullet_times(proposed_times, timezone)
+            )
         else:
-            return f"""Hi {candidate_name},
-
-We'd be happy to reschedule. Could you please share your preferred times and we'll check our availability?
-
-Best regards,
-Schedule Helper"""
+            return _TEMPLATES["reschedule_no_times"].format(name=candidate_name)
 
     elif intent == "confirm":
-        return f"""Hi {candidate_name},
-
-Perfect! We have you confirmed for the meeting.
-
-We look forward to speaking with you then. You'll receive a calendar invitation shortly with all the details.
-
-Best regards,
-Schedule Helper"""
+        return _TEMPLATES["confirm"].format(name=candidate_name)
 
     elif intent == "available" or intent == "available_no_times":
         if proposed_times:
-            time_lines = "\n".join([f"• {format_time_human_readable(t, timezone)}" for t in proposed_times])
-            return f"""Hi {candidate_name},
-
-Thank you for sharing your availability!
-
-We'd like to schedule the meeting for one of these times:
-
-{time_lines}
-
-Please confirm which time works best for you, and we'll send over a calendar invitation.
-
-Best regards,
-Schedule Helper"""
+            return _TEMPLATES["available"].format(
+                name=candidate_name,
+                time_lines=_bullet_times(proposed_times, timezone)
+            )
         else:
-            return f"""Hi {candidate_name},
-
-Thank you for your message! To help us find the best time for our meeting, could you please share a few specific times that work for you?
-
-For example:
-• Day of the week and time (e.g., "Tuesday at 2pm")
-• Multiple options if possible
-• Your timezone
-
-We'll do our best to accommodate your schedule.
-
-Best regards,
-Schedule Helper"""
+            return _TEMPLATES["available_no_times"].format(name=candidate_name)
 
     else:  # unknown or other intents
-        return f"""Hi {candidate_name},
-
-Thank you for your message. To help us schedule our meeting, could you please let us know:
-
-• Your preferred days and times
-• Your timezone
-• Any dates that definitely won't work
-
-We'll get back to you promptly with available options.
-
-Best regards,
-Schedule Helper"""
+        return _TEMPLATES["unknown"].format(name=candidate_name)
 
 def generate_reply(
     candidate_name: Optional[str] = None,
@@ -0,0 +1,25 @@
+# mcp/tools/iso_time.py - shared ISO 8601 parsing helper
+
+import sys
+from datetime import datetime
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing 'Z' natively from 3.11, so no
+    # pre-scan, no string copy - just the C parser
+    parse_iso = datetime.fromisoformat
+else:
+    def parse_iso(time_str: str) -> datetime:
+        """
+        Parse an ISO 8601 string, tolerating the trailing 'Z' suffix
+
+        Args:
+            time_str: ISO format time string
+
+        Returns:
+            Parsed datetime
+        """
+        # 'Z' only ever appears as the last character of well-formed input,
+        # so slice instead of scanning the whole string with replace()
+        if time_str.endswith('Z'):
+            time_str = time_str[:-1] + '+00:00'
+        return datetime.fromisoformat(time_str)
@@ -1,64 +1,157 @@
 from protocol import ParsedAvailability
 import re
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone as _timezone
 from typing import List, Optional
-import pytz
+from dateutil import parser as date_parser
+
+from tools.tz_cache import get_tz
+
+# Comprehensive patterns for time extraction, compiled once at import and
+# unioned so extraction walks the text a single time. Input is lowercased
+# before matching, so no IGNORECASE flag is needed.
+_TIME_PATTERNS = [
+    # Day + time patterns
+    r"(tomorrow|today)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
+    r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
+    r"\d{1,2}(:\d{2})?\s*(am|pm)\s+on\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
+
+    # Date + time patterns
+    r"\d{1,2}/\d{1,2}(/\d{4})?\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
+    r"(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(st|nd|rd|th)?\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
+
+    # Flexible patterns
+    r"available\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+\d{1,2}(:\d{2})?\s*(am|pm)",
+    r"free\s+(tomorrow|today)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
+]
+_TIME_RE = re.compile("|".join(f"(?:{p})" for p in _TIME_PATTERNS))
+
+# Explicit calendar dates (7/15, "january 15th") name one specific day and
+# must not be rolled forward by a week; an explicit year pins them entirely
+_EXPLICIT_DATE_RE = re.compile(
+    r"\d{1,2}/\d{1,2}"
+    r"|(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}"
+)
+_EXPLICIT_YEAR_RE = re.compile(r"\b\d{4}\b")
+
+# Optional: Hyperscan evaluates every pattern in one linear DFA scan with no
+# backtracking. It is a heavyweight native dependency, so it stays optional -
+# when unavailable the compiled union regex above is used instead.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_HS_DB = None
+if hyperscan is not None:
+    try:
+        _HS_DB = hyperscan.Database()
+        _HS_DB.compile(
+            expressions=[p.encode() for p in _TIME_PATTERNS],
+            ids=list(range(len(_TIME_PATTERNS))),
+            flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST]
+            * len(_TIME_PATTERNS),
+        )
+    except Exception:
+        _HS_DB = None
+
+def _find_time_phrases(text_lower: str) -> List[str]:
+    """Return the raw time phrases found in lowercased text
+
+    Uses the Hyperscan database when the library is installed, otherwise
+    the compiled union regex. Both return phrases in scan order.
+    """
+    if _HS_DB is not None:
+        data = text_lower.encode()
+        spans = []
+
+        def _on_match(pattern_id, start, end, flags, context):
+            spans.append((start, end))
+
+        _HS_DB.scan(data, match_event_handler=_on_match)
+        return [data[start:end].decode() for start, end in sorted(spans)]
+    return [match.group(0) for match in _TIME_RE.finditer(text_lower)]
+
+# Intent keywords in priority order - plain substring semantics, first
+# intent with any hit wins
+_INTENT_KEYWORDS = {
+    'cancel': ['cancel', 'cannot make it', "can't make it", 'not available', 'unavailable'],
+    'reschedule': ['reschedule', 'change', 'move', 'different time', 'another time'],
+    'confirm': ['confirm', 'sounds good', 'works for me', 'see you then'],
+    'available': ['available', 'free', 'open', 'can do', 'works'],
+}
+
+# One compiled alternation per intent (escaped, substring semantics) for
+# the fallback path
+_INTENT_RES = {
+    intent: re.compile("|".join(map(re.escape, keywords)))
+    for intent, keywords in _INTENT_KEYWORDS.items()
+}
+
+# Optional: an Aho-Corasick automaton finds every keyword of every intent
+# in one linear pass over the text instead of one scan per intent
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+_INTENT_AUTOMATON = None
+if ahocorasick is not None:
+    _INTENT_AUTOMATON = ahocorasick.Automaton()
+    for _intent, _keywords in _INTENT_KEYWORDS.items():
+        for _keyword in _keywords:
+            _INTENT_AUTOMATON.add_word(_keyword, _intent)
+    _INTENT_AUTOMATON.make_automaton()
 
 def convert_natural_to_iso(natural_time: str, base_timezone: str = "UTC") -> Optional[str]:
     """Convert natural language time to proper ISO format"""
     try:
         # Get current date as reference
         if base_timezone == "UTC":
-            now = datetime.now(pytz.UTC)
+            now = datetime.now(_timezone.utc)
         else:
-            tz = pytz.timezone(base_timezone)
-            now = datetime.now(tz)
-        
-        # Day patterns
-        if "tomorrow" in natural_time.lower():
-            target_date = now + timedelta(days=1)
-        elif "today" in natural_time.lower():
-            target_date = now
+            now = datetime.now(get_tz(base_timezone))
+
+        lowered = natural_time.lower()
+
+        # dateutil doesn't understand relative day words - handle them as a
+        # quick branch, then let its C-backed tokenizer do the real parsing
+        # (weekday names, dates like 7/15 or "january 15th", am/pm times)
+        relative_day = True
+        if "tomorrow" in lowered:
+            default = now + timedelta(days=1)
+            lowered = lowered.replace("tomorrow", "")
+        elif "today" in lowered:
+            default = now
+            lowered = lowered.replace("today", "")
         else:
-            # Handle weekday names
-            weekdays = {
-                'monday': 0, 'tuesday': 1, 'wednesday': 2, 'thursday': 3,
-                'friday': 4, 'saturday': 5, 'sunday': 6
-            }
-            
-            for day_name, day_num in weekdays.items():
-                if day_name in natural_time.lower():
-                    days_ahead = day_num - now.weekday()
-                    if days_ahead <= 0:  # Target day has passed this week
-                        days_ahead += 7
-                    target_date = now + timedelta(days=days_ahead)
-                    break
+            default = now
+            relative_day = False
+
+        # Zero the sub-hour fields on the default: dateutil only fills in
+        # what the phrase mentions, so "2pm" must not inherit current minutes
+        result_dt = date_parser.parse(
+            lowered, fuzzy=True,
+            default=default.replace(minute=0, second=0, microsecond=0)
+        )
+
+        # Scheduling only proposes future times, but how a past result rolls
+        # forward depends on what the phrase named: a bare weekday means its
+        # next occurrence, a month/day means that date next year, and a date
+        # with an explicit year can't be moved without changing the request
+        if not relative_day and result_dt <= now:
+            if _EXPLICIT_DATE_RE.search(lowered):
+                if _EXPLICIT_YEAR_RE.search(lowered):
+                    return None
+                result_dt = result_dt.replace(year=result_dt.year + 1)
             else:
-                # If no specific day found, assume next week
-                target_date = now + timedelta(days=7)
-        
-        # Time patterns
-        time_match = re.search(r'(\d{1,2})(:\d{2})?\s*(am|pm)', natural_time.lower())
-        if time_match:
-            hour = int(time_match.group(1))
-            minute = int(time_match.group(2)[1:]) if time_match.group(2) else 0
-            am_pm = time_match.group(3)
-            
-            # Convert to 24-hour format
-            if am_pm == 'pm' and hour != 12:
-                hour += 12
-            elif am_pm == 'am' and hour == 12:
-                hour = 0
-                
-            # Create the datetime in the specified timezone
-            result_dt = target_date.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            
-            # Convert to UTC and return with Z suffix (proper ISO format)
-            if base_timezone != "UTC":
-                result_dt = result_dt.astimezone(pytz.UTC)
-            
-            return result_dt.isoformat().replace('+00:00', 'Z')
-            
+                result_dt += timedelta(days=7)
+
+        # Convert to UTC and return with Z suffix (proper ISO format)
+        if base_timezone != "UTC":
+            result_dt = result_dt.astimezone(_timezone.utc)
+
+        return result_dt.isoformat().replace('+00:00', 'Z')
+
     except Exception as e:
         print(f"Error converting '{natural_time}': {e}")
         return None
@@ -74,33 +167,15 @@ def enhanced_extract_times(text: str, timezone: str = "UTC") -> List[str]:
     Returns:
         List of ISO format time strings
     """
-    # Comprehensive patterns for time extraction
-    patterns = [
-        # Day + time patterns
-        r"(tomorrow|today)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
-        r"(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
-        r"\d{1,2}(:\d{2})?\s*(am|pm)\s+on\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)",
-        
-        # Date + time patterns
-        r"\d{1,2}/\d{1,2}(/\d{4})?\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
-        r"(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(st|nd|rd|th)?\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
-        
-        # Flexible patterns
-        r"available\s+(monday|tuesday|wednesday|thursday|friday|saturday|sunday)\s+\d{1,2}(:\d{2})?\s*(am|pm)",
-        r"free\s+(tomorrow|today)\s+at\s+\d{1,2}(:\d{2})?\s*(am|pm)",
-    ]
-    
     matches = []
     text_lower = text.lower()
-    
-    for pattern in patterns:
-        found = re.finditer(pattern, text_lower, re.IGNORECASE)
-        for match in found:
-            time_str = match.group(0)
-            iso_time = convert_natural_to_iso(time_str, timezone)
-            if iso_time and iso_time not in matches:  # Avoid duplicates
-                matches.append(iso_time)
-    
+
+    # One pass over the text instead of one scan per individual pattern
+    for time_str in _find_time_phrases(text_lower):
+        iso_time = convert_natural_to_iso(time_str, timezone)
+        if iso_time and iso_time not in matches:  # Avoid duplicates
+            matches.append(iso_time)
+
     return matches
 
 def detect_intent(email_body: str) -> str:
@@ -114,25 +189,21 @@ def detect_intent(email_body: str) -> str:
         Intent string: available, reschedule, cancel, confirm, etc.
     """
     text_lower = email_body.lower()
-    
-    # Intent keywords
-    reschedule_keywords = ['reschedule', 'change', 'move', 'different time', 'another time']
-    cancel_keywords = ['cancel', 'cannot make it', "can't make it", 'not available', 'unavailable']
-    confirm_keywords = ['confirm', 'sounds good', 'works for me', 'see you then']
-    available_keywords = ['available', 'free', 'open', 'can do', 'works']
-    
-    # Check for specific intents
-    if any(keyword in text_lower for keyword in cancel_keywords):
-        return "cancel"
-    elif any(keyword in text_lower for keyword in reschedule_keywords):
-        return "reschedule"
-    elif any(keyword in text_lower for keyword in confirm_keywords):
-        return "confirm"
-    elif any(keyword in text_lower for keyword in available_keywords):
-        return "available"
-    else:
+
+    if _INTENT_AUTOMATON is not None:
+        # Single pass over the text; then pick the highest-priority hit
+        found = {intent for _end, intent in _INTENT_AUTOMATON.iter(text_lower)}
+        for intent in _INTENT_KEYWORDS:
+            if intent in found:
+                return intent
         return "unknown"
 
+    # Fallback: one compiled-alternation scan per intent, in priority order
+    for intent, pattern in _INTENT_RES.items():
+        if pattern.search(text_lower):
+            return intent
+    return "unknown"
+
 def parse_email(
     email_body: str, 
     from_email: str = "", 
@@ -163,5 +234,8 @@ def parse_email(
         type="parsed_availability",
         extracted_times=times,
         intent=intent,
-        raw_context=email_body[:1000]  # Keep context for downstream processing
+        # Keep context for downstream processing; short emails (the common
+        # case) reuse the original string instead of paying for a copy -
+        # slicing a str always allocates, even for s[:1000] of a short s
+        raw_context=email_body if len(email_body) <= 1000 else email_body[:1000]
     )
\ No newline at end of file
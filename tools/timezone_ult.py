@@ -1,11 +1,41 @@
 from protocol import ConvertTimezoneOutput
-from datetime import datetime
-import pytz
+import logging
+import sys
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from zoneinfo import ZoneInfoNotFoundError, available_timezones
 from dateutil import parser
-from typing import Dict
+from typing import List, Mapping
 
-# Common timezone abbreviation mappings
-TIMEZONE_MAPPINGS: Dict[str, str] = {
+from tools.tz_cache import get_tz
+
+logger = logging.getLogger(__name__)
+
+# Optional: ciso8601 parses ISO strings in C, roughly an order of magnitude
+# faster than dateutil. Exotic formats fall through to the chain below, and
+# without the package the behavior is unchanged.
+try:
+    from ciso8601 import parse_datetime as _ciso_parse
+except ImportError:
+    _ciso_parse = None
+
+# Optional: pandas parses and converts whole batches in one vectorized C
+# kernel. Too heavy to require for a per-call tool, so it stays optional -
+# without it (or for small batches) the plain loop runs instead.
+try:
+    import pandas as _pd
+except ImportError:
+    _pd = None
+
+# Below this size the to_datetime setup overhead beats the loop it saves
+_PANDAS_BATCH_MIN = 64
+
+# Common timezone abbreviation mappings. Read-only: normalize_timezone's
+# memoization (and anything else caching derived lookups) relies on this
+# table never changing after import.
+TIMEZONE_MAPPINGS: Mapping[str, str] = MappingProxyType({
     # US Timezones
     'PST': 'America/Los_Angeles',
     'PDT': 'America/Los_Angeles',
@@ -27,20 +57,57 @@ TIMEZONE_MAPPINGS: Dict[str, str] = {
     # Keep UTC as is
     'UTC': 'UTC',
     'Z': 'UTC',
-}
+})
+
+# Longest abbreviation in the table - anything longer can't be in it
+_TZ_ABBREV_MAX_LEN = max(map(len, TIMEZONE_MAPPINGS))
+
+# The same table resolved to tzinfo objects at import: a hit here turns the
+# whole normalize/validate/lookup chain into a single dict probe
+_TZ_OBJECTS: Mapping[str, object] = MappingProxyType({
+    abbrev: get_tz(iana) for abbrev, iana in TIMEZONE_MAPPINGS.items()
+})
+
+# UTC conversions dominate this tool's traffic; resolve the common spellings
+# straight to the fixed-offset singleton (astimezone's cheapest case) without
+# normalize/validate/cache probes
+_UTC = timezone.utc
+_UTC_NAMES = frozenset({'UTC', 'utc', 'Z', 'z', 'GMT', 'gmt'})
+
+# Every valid zone key, snapshotted once at import: validation becomes a
+# C-level set probe instead of a tzdata lookup (with its miss exception).
+# Abbreviations like 'PST' still go through normalize_timezone first, so
+# validate_timezone keeps its strict IANA-name semantics.
+try:
+    _KNOWN_TZS = frozenset(available_timezones())
+except Exception:
+    _KNOWN_TZS = None
 
+# Every failure returns the same payload, so build (and validate) it once.
+# The model is not frozen - callers must treat this as read-only, which all
+# current ones do (they only serialize it).
+_ERROR_OUTPUT = ConvertTimezoneOutput(result=None)
+
+@lru_cache(maxsize=256)
 def normalize_timezone(tz_str: str) -> str:
     """
     Normalize timezone string to a standard format
-    
+
+    Pure function over a handful of distinct inputs per workload, so the
+    cache turns repeat calls into a single hash probe.
+
     Args:
         tz_str: Timezone string (could be abbreviation or full name)
-        
+
     Returns:
         Normalized timezone string
     """
-    tz_upper = tz_str.upper().strip()
-    return TIMEZONE_MAPPINGS.get(tz_upper, tz_str)
+    tz_str = tz_str.strip()
+    # IANA names like America/Los_Angeles are longer than any abbreviation
+    # and contain '/' - skip the uppercase copy and table probe for them
+    if len(tz_str) <= _TZ_ABBREV_MAX_LEN and '/' not in tz_str:
+        return TIMEZONE_MAPPINGS.get(tz_str.upper(), tz_str)
+    return tz_str
 
 def validate_timezone(tz_str: str) -> bool:
     """
@@ -52,10 +119,13 @@ def validate_timezone(tz_str: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    if _KNOWN_TZS is not None:
+        return tz_str in _KNOWN_TZS
+    # Slow path if the tzdata key listing wasn't available at import
     try:
-        pytz.timezone(tz_str)
+        get_tz(tz_str)
         return True
-    except pytz.exceptions.UnknownTimeZoneError:
+    except (ZoneInfoNotFoundError, ValueError):
         return False
 
 def parse_time_string(time_str: str) -> datetime:
@@ -73,27 +143,122 @@ def parse_time_string(time_str: str) -> datetime:
     """
     # Remove common suffixes and normalize
     time_str = time_str.strip()
-    
-    # Handle 'Z' suffix (UTC indicator)
-    if time_str.endswith('Z'):
+
+    # 'Z' suffix (UTC indicator): every parser below accepts it natively on
+    # 3.11+, so the rewrite - a branch plus a string allocation per call -
+    # only survives for older interpreters
+    if sys.version_info < (3, 11) and time_str.endswith('Z'):
         time_str = time_str[:-1] + '+00:00'
-    
-    # Try different parsing approaches
+
+    # C fast path for the dominant well-formed ISO inputs
+    if _ciso_parse is not None:
+        try:
+            return _ciso_parse(time_str)
+        except ValueError:
+            pass
+
+    # Fastest first: fromisoformat is C and, on 3.11+, already accepts the
+    # fractional-second variants the old microsecond-stripping retry covered
+    try:
+        return datetime.fromisoformat(time_str)
+    except ValueError:
+        pass
+
+    # dateutil handles the remaining exotic ISO variants
     try:
-        # First try dateutil parser (most flexible)
         return parser.isoparse(time_str)
     except (ValueError, parser.ParserError):
+        raise ValueError(f"Unable to parse time string: {time_str}")
+
+def _resolve_zone(tz_str: str, role: str,
+                  _utc=_UTC, _utc_names=_UTC_NAMES, _tz_objects=_TZ_OBJECTS,
+                  _normalize=normalize_timezone, _get_tz=get_tz):
+    """Resolve a timezone name to a tzinfo object, cheapest path first
+
+    UTC spellings hit the fixed-offset singleton, known abbreviations the
+    pre-built table; only unmapped names take normalize + the get_tz cache,
+    whose miss doubles as validation. Raises ValueError (mentioning `role`)
+    for unknown names.
+    """
+    if tz_str in _utc_names:
+        return _utc
+    zone = _tz_objects.get(tz_str.upper())
+    if zone is not None:
+        return zone
+    try:
+        return _get_tz(_normalize(tz_str))
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValueError(f"Invalid {role} timezone: {tz_str}")
+
+def _convert(time_str: str, from_tz: str, to_tz: str,
+             _resolve=_resolve_zone, _parse=parse_time_string) -> str:
+    """Resolve zones, parse and convert in one frame; returns the ISO string
+
+    The keyword defaults bind the helpers as locals at definition time,
+    so this short hot path avoids a LOAD_GLOBAL per lookup.
+    """
+    from_zone = _resolve(from_tz, "source")
+    to_zone = _resolve(to_tz, "target")
+
+    dt = _parse(time_str)
+
+    # Naive datetimes get the source timezone attached (zoneinfo keys are
+    # DST-correct with a plain replace); aware ones already carry their
+    # offset, so from_tz is ignored and the intermediate hop is skipped
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=from_zone)
+
+    # Convert and format (ISO format with timezone info)
+    return dt.astimezone(to_zone).isoformat()
+
+def convert_timezone_batch(
+    time_strs: List[str],
+    from_tz: str,
+    to_tz: str
+) -> List[str]:
+    """
+    Convert many time strings between the same pair of timezones.
+
+    Resolves both tzinfo objects once, so the per-item cost is just
+    parse + astimezone - the normalize/validate/cache probes are
+    amortized across the whole batch.
+
+    Args:
+        time_strs: Time strings to convert (same formats as convert_timezone)
+        from_tz: Source timezone, applied to naive time strings
+        to_tz: Target timezone
+
+    Returns:
+        Converted ISO time strings, in input order
+
+    Raises:
+        ValueError: If a timezone name or time string is invalid
+    """
+    from_zone = _resolve_zone(from_tz, "source")
+    to_zone = _resolve_zone(to_tz, "target")
+
+    if _pd is not None and len(time_strs) >= _PANDAS_BATCH_MIN:
         try:
-            # Try standard ISO format
-            return datetime.fromisoformat(time_str)
-        except ValueError:
-            try:
-                # Try with microseconds stripped
-                if '.' in time_str:
-                    time_str = time_str.split('.')[0]
-                return datetime.fromisoformat(time_str)
-            except ValueError:
-                raise ValueError(f"Unable to parse time string: {time_str}")
+            idx = _pd.to_datetime(list(time_strs), format='ISO8601')
+            if idx.tz is None:
+                idx = idx.tz_localize(from_zone)
+            rendered = idx.tz_convert(to_zone).strftime('%Y-%m-%dT%H:%M:%S%z')
+            # isoformat writes the offset with a colon; %z does not
+            return [s[:-2] + ':' + s[-2:] for s in rendered]
+        except Exception:
+            # Mixed offsets or formats pandas won't take as one dtype -
+            # the per-item loop below handles them all
+            pass
+
+    _parse = parse_time_string
+    out = []
+    append = out.append
+    for time_str in time_strs:
+        dt = _parse(time_str)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=from_zone)
+        append(dt.astimezone(to_zone).isoformat())
+    return out
 
 def convert_timezone(
     time_str: str,
@@ -105,74 +270,62 @@ def convert_timezone(
 
     Args:
         time_str (str): Time string (e.g., '2025-06-20T14:00:00', '2025-06-20T14:00:00Z')
-        from_tz (str): Source timezone (e.g., 'PST', 'America/Los_Angeles', 'UTC')
+        from_tz (str): Source timezone (e.g., 'PST', 'America/Los_Angeles', 'UTC').
+            Only applied to naive time strings; an explicit offset in
+            time_str takes precedence.
         to_tz (str): Target timezone (e.g., 'UTC', 'EST', 'Europe/London')
 
     Returns:
         ConvertTimezoneOutput: Result with converted time or None if error
     """
     try:
-        # Normalize timezone names
-        from_tz_normalized = normalize_timezone(from_tz)
-        to_tz_normalized = normalize_timezone(to_tz)
-        
-        # Validate timezones
-        if not validate_timezone(from_tz_normalized):
-            raise ValueError(f"Invalid source timezone: {from_tz}")
-        
-        if not validate_timezone(to_tz_normalized):
-            raise ValueError(f"Invalid target timezone: {to_tz}")
-        
-        # Create timezone objects
-        from_zone = pytz.timezone(from_tz_normalized)
-        to_zone = pytz.timezone(to_tz_normalized)
-        
-        # Parse the time string
-        dt = parse_time_string(time_str)
-        
-        # Handle timezone-aware vs naive datetimes
-        if dt.tzinfo is None:
-            # Naive datetime - localize to source timezone
-            dt_localized = from_zone.localize(dt)
-        else:
-            # Already timezone-aware - convert to source timezone first if needed
-            dt_localized = dt.astimezone(from_zone)
-        
-        # Convert to target timezone
-        dt_converted = dt_localized.astimezone(to_zone)
-        
-        # Format output (ISO format with timezone info)
-        result = dt_converted.isoformat()
-        
-        return ConvertTimezoneOutput(result=result)
-        
+        return ConvertTimezoneOutput(result=_convert(time_str, from_tz, to_tz))
     except Exception as e:
-        error_msg = f"Timezone conversion error: {str(e)}"
-        print(f"[timezone_ult] {error_msg}")
-        return ConvertTimezoneOutput(result=None)
+        # Lazy %-formatting: the message is only built if a handler wants it
+        logger.error("Timezone conversion error: %s", e)
+        return _ERROR_OUTPUT
+
+@lru_cache(maxsize=128)
+def _tz_info_cached(tz_normalized: str, minute_bucket: int) -> dict:
+    """Build the info dict once per (timezone, minute) - the strftime and
+    dst work is amortized across all calls within the same minute"""
+    tz = get_tz(tz_normalized)
+    now = datetime.now(tz)
+
+    # Read the offset once and format everything by hand - utc_offset and
+    # current_time share one pass of integer math instead of strftime and
+    # isoformat each rebuilding the offset. Sub-second precision is dropped:
+    # it was already meaningless under the minute-bucket cache.
+    total_seconds = int(now.utcoffset().total_seconds())
+    sign = '+' if total_seconds >= 0 else '-'
+    hours, minutes = divmod(abs(total_seconds) // 60, 60)
+
+    return {
+        "timezone": tz_normalized,
+        "abbreviation": now.tzname(),
+        "utc_offset": f"{sign}{hours:02d}{minutes:02d}",
+        "is_dst": bool(now.dst()),
+        "current_time": (
+            f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+            f"T{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+            f"{sign}{hours:02d}:{minutes:02d}"
+        )
+    }
 
 def get_timezone_info(tz_str: str) -> dict:
     """
     Get information about a timezone
-    
+
     Args:
         tz_str: Timezone string
-        
+
     Returns:
-        Dictionary with timezone information
+        Dictionary with timezone information (current_time has
+        minute-level freshness)
     """
     try:
         tz_normalized = normalize_timezone(tz_str)
-        tz = pytz.timezone(tz_normalized)
-        now = datetime.now(tz)
-        
-        return {
-            "timezone": tz_normalized,
-            "abbreviation": now.strftime('%Z'),
-            "utc_offset": now.strftime('%z'),
-            "is_dst": bool(now.dst()),
-            "current_time": now.isoformat()
-        }
+        return _tz_info_cached(tz_normalized, int(time.time()) // 60)
     except Exception as e:
         return {
             "error": f"Unable to get timezone info: {str(e)}"
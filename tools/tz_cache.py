@@ -0,0 +1,26 @@
+# mcp/tools/tz_cache.py - shared timezone object cache
+
+from functools import lru_cache
+from zoneinfo import ZoneInfo
+
+
+@lru_cache(maxsize=512)
+def get_tz(name: str) -> ZoneInfo:
+    """
+    Resolve a timezone name to a tzinfo object, caching the result
+
+    zoneinfo keys are DST-correct with plain dt.replace(tzinfo=...), so
+    callers don't need pytz's localize dance. ZoneInfo keeps its own
+    per-key cache in C; the LRU on top makes repeat lookups a single
+    dict probe without touching the constructor at all.
+
+    Args:
+        name: Timezone name (e.g. 'UTC', 'America/Los_Angeles')
+
+    Returns:
+        The ZoneInfo object for the name
+
+    Raises:
+        zoneinfo.ZoneInfoNotFoundError: If the name is not a known zone
+    """
+    return ZoneInfo(name)